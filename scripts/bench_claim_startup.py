@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+"""
+StealthFlow Claim Script - Startup Benchmark
+=============================================
+
+Measures wall-clock time for gasless_claim.py on the paths that should never
+touch the network or the heavy Starknet dependencies.
+
+USAGE:
+    python3 scripts/bench_claim_startup.py [--runs 20]
+
+Each scenario is run in a fresh interpreter (startup cost is what we measure),
+and reported next to a bare `python -c pass` baseline. If starknet_py is
+installed, the cost of eagerly importing it is shown for comparison.
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import time
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gasless_claim.py")
+
+SCENARIOS = [
+    ("python -c pass (baseline)", ["-c", "pass"]),
+    ("--help", [SCRIPT, "--help"]),
+    ("missing arguments", [SCRIPT]),
+    ("invalid amount", [SCRIPT, "--stealth-priv", "0x1", "--to", "0x2", "--amount", "abc"]),
+    ("missing sponsor config", [SCRIPT, "--stealth-priv", "0x1", "--to", "0x2"]),
+]
+
+EAGER_IMPORTS = (
+    "import dotenv, poseidon_py.poseidon_hash, asyncio;"
+    "import starknet_py.net.full_node_client, starknet_py.net.account.account"
+)
+
+def time_run(argv: list, runs: int) -> list:
+    # Force the "sponsor missing" path (single sponsor and pool); load_dotenv() never
+    # overrides existing variables, so a configured .env cannot send real claims
+    env = dict(
+        os.environ,
+        SPONSOR_ADDRESS="0x0", SPONSOR_PRIVATE_KEY="0x0",
+        SPONSOR_ADDRESSES="", SPONSOR_PRIVATE_KEYS="",
+    )
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gasless_claim.py startup time.")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per scenario (default: 20)")
+    args = parser.parse_args()
+
+    scenarios = list(SCENARIOS)
+    probe = subprocess.run([sys.executable, "-c", EAGER_IMPORTS], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if probe.returncode == 0:
+        scenarios.append(("eager starknet_py/poseidon/dotenv imports", ["-c", EAGER_IMPORTS]))
+
+    print(f"\n{'scenario':<45} {'median ms':>10} {'min ms':>10}")
+    print("-" * 67)
+    for name, argv in scenarios:
+        samples = time_run(argv, args.runs)
+        print(f"{name:<45} {statistics.median(samples):>10.1f} {min(samples):>10.1f}")
+    print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""
+StealthFlow Batch Engine - Scalar vs NumPy Crossover Benchmark
+===============================================================
+
+Times the scalar (Python int) path against the vectorized NumPy path in
+stealth_batch.py for growing batch sizes, checks that both return identical
+results, and reports the smallest batch size where NumPy wins.
+
+USAGE:
+    python3 scripts/bench_field_batch.py [--sizes 1,4,16,64,256] [--op ecdh|field-mul]
+
+OPERATIONS:
+    ecdh       view_priv * ephemeral_pub for a batch of announcements (scanner hot path)
+    field-mul  a * b mod P for a batch of field elements
+
+A lone field multiply never beats Python's native bigint `*` and `%`; the win
+comes from curve operations, where the scalar path pays a modular inversion per
+point add and the vectorized path stays in Jacobian coordinates.
+"""
+
+import sys
+import argparse
+import random
+import time
+
+import stealth_batch
+from stealth_sdk import P, N, G, point_mul
+
+def bench(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_ecdh(size: int, rng: random.Random, repeat: int):
+    view_priv = rng.randrange(1, N)
+    ephemeral_pubs = [point_mul(rng.randrange(1, N), G) for _ in range(size)]
+    scalar = stealth_batch.batch_scalar_mul(view_priv, ephemeral_pubs, use_numpy=False)
+    vector = stealth_batch.batch_scalar_mul(view_priv, ephemeral_pubs, use_numpy=True)
+    assert scalar == vector, "NumPy and scalar ECDH results differ"
+    t_scalar = bench(lambda: stealth_batch.batch_scalar_mul(view_priv, ephemeral_pubs, use_numpy=False), repeat)
+    t_vector = bench(lambda: stealth_batch.batch_scalar_mul(view_priv, ephemeral_pubs, use_numpy=True), repeat)
+    return t_scalar, t_vector
+
+def run_field_mul(size: int, rng: random.Random, repeat: int):
+    a = [rng.randrange(P) for _ in range(size)]
+    b = [rng.randrange(P) for _ in range(size)]
+
+    def vector():
+        return stealth_batch.from_limbs(stealth_batch.fe_mul(stealth_batch.to_limbs(a), stealth_batch.to_limbs(b)))
+
+    def scalar():
+        return [x * y % P for x, y in zip(a, b)]
+
+    assert scalar() == vector(), "NumPy and scalar field products differ"
+    return bench(scalar, repeat), bench(vector, repeat)
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the scalar/NumPy crossover batch size.")
+    parser.add_argument("--op", choices=["ecdh", "field-mul"], default="ecdh")
+    parser.add_argument("--sizes", default="1,4,16,32,64,128", help="Comma-separated batch sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats per size (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not stealth_batch.HAS_NUMPY:
+        print("❌ NumPy is not installed (pip install numpy)")
+        sys.exit(1)
+
+    rng = random.Random(args.seed)
+    run = run_ecdh if args.op == "ecdh" else run_field_mul
+
+    print(f"\n[{args.op}] current NUMPY_MIN_BATCH = {stealth_batch.NUMPY_MIN_BATCH}")
+    print(f"{'batch':>8} {'scalar ms':>12} {'numpy ms':>12} {'speedup':>9}")
+    print("-" * 44)
+    crossover = None
+    for size in (int(s) for s in args.sizes.split(",")):
+        t_scalar, t_vector = run(size, rng, args.repeat)
+        speedup = t_scalar / t_vector
+        if crossover is None and speedup > 1:
+            crossover = size
+        print(f"{size:>8} {t_scalar * 1000:>12.2f} {t_vector * 1000:>12.2f} {speedup:>8.2f}x")
+
+    if crossover is None:
+        print("\nNumPy did not overtake the scalar path at these sizes")
+    else:
+        print(f"\nCrossover: NumPy wins from batch size ~{crossover}")
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,19 @@ The sponsor pays gas fees for deployment and transfer in a single atomic transac
 
 USAGE:
     python3 gasless_claim.py --stealth-priv <PRIVATE_KEY> --to <RECIPIENT_ADDRESS> [--amount <AMOUNT_WEI>]
+    python3 gasless_claim.py --claims-file <CLAIMS_JSON>
 
 REQUIRED ENVIRONMENT VARIABLES:
     SPONSOR_ADDRESS      - Address of the sponsor account
     SPONSOR_PRIVATE_KEY  - Private key of the sponsor account
     STARKNET_RPC_URL     - (Optional) Custom RPC URL, defaults to Alchemy Sepolia
 
+SPONSOR POOL (optional, instead of or in addition to SPONSOR_ADDRESS/SPONSOR_PRIVATE_KEY):
+    SPONSOR_ADDRESSES    - Comma-separated sponsor addresses
+    SPONSOR_PRIVATE_KEYS - Comma-separated private keys, same order as SPONSOR_ADDRESSES
+    SPONSOR_MIN_BALANCE  - (Optional) Minimum STRK balance in wei for a sponsor to be used,
+                           defaults to the maximum fee of one claim transaction
+
 EXAMPLES:
     # Sweep all funds from stealth address to recipient:
     python3 gasless_claim.py --stealth-priv 0x1234...abcd --to 0xrecipient...
@@ -22,6 +29,10 @@ EXAMPLES:
     # Transfer specific amount (in wei):
     python3 gasless_claim.py --stealth-priv 0x1234...abcd --to 0xrecipient... --amount 1000000000000000000
 
+    # Submit many claims concurrently, spread across the sponsor pool:
+    python3 gasless_claim.py --claims-file claims.json
+    # claims.json: [{"stealth_priv": "0x...", "to": "0x...", "amount": "0"}, ...]
+
 NOTES:
     - The stealth private key is provided by the sender when they send you funds
     - The recipient address should be your wallet address where you want to receive funds
@@ -30,26 +41,14 @@ NOTES:
 
 import os
 import sys
-import asyncio
 import argparse
-import dataclasses
 import random
+import time
 
-# Load .env file if present (for easier local configuration)
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # Load from .env in current directory or parent directories
-except ImportError:
-    pass  # python-dotenv not installed, use shell environment only
-
-from starknet_py.net.full_node_client import FullNodeClient
-from starknet_py.net.account.account import Account
-from starknet_py.net.models import StarknetChainId
-from starknet_py.net.signer.stark_curve_signer import KeyPair, StarkCurveSigner
-from starknet_py.hash.address import compute_address
-from starknet_py.net.client_models import Call, ResourceBounds, ResourceBoundsMapping
-from starknet_py.hash.selector import get_selector_from_name
-from poseidon_py.poseidon_hash import poseidon_hash_many
+# Heavy dependencies (starknet_py, poseidon_py, dotenv, asyncio) are imported
+# lazily on the code paths that need them, so --help, argument errors and a
+# missing sponsor config exit without paying for them.
+# Use scripts/bench_claim_startup.py to measure startup time.
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -60,6 +59,15 @@ STEALTH_ACCOUNT_CLASS_HASH = 0x03487cf5ae2106db423e02de50b934643c63d893f81696600
 STRK_TOKEN = 0x04718f5a0fc34cc1af16a1cdee98ffb20c31f5cd61d6ab07201858f4287c938d
 UDC_ADDRESS = 0x041a78e741e5af2fec34b695679bc6891742439f7afb8484ecd7766661ad02bf
 GAS_REIMBURSEMENT = 10_000_000_000_000_000 # 0.01 STRK
+SPONSOR_BALANCE_TTL = 5.0 # seconds a sponsor balance read stays valid for routing
+CLAIMS_PER_SPONSOR = 2 # concurrent claims per sponsor in --claims-file mode (overlaps RPC prep with submission)
+
+# Sponsor transaction resource bounds: (max_amount, max_price_per_unit)
+L1_GAS_BOUNDS = (2000, 500_000_000_000_000)
+L1_DATA_GAS_BOUNDS = (20000, 500_000_000_000_000)
+L2_GAS_BOUNDS = (50_000_000, 10_000_000_000)
+# The sequencer rejects a V3 tx unless the sponsor can cover these bounds in full
+MAX_CLAIM_FEE = sum(amount * price for amount, price in (L1_GAS_BOUNDS, L1_DATA_GAS_BOUNDS, L2_GAS_BOUNDS))
 
 # Default Sponsor (can be overridden via environment variables)
 DEFAULT_SPONSOR_ADDRESS = "0x0"
@@ -68,6 +76,40 @@ DEFAULT_SPONSOR_PRIVATE_KEY = "0x0"
 SPONSOR_ADDRESS = int(os.environ.get("SPONSOR_ADDRESS", DEFAULT_SPONSOR_ADDRESS), 16)
 SPONSOR_PRIVATE_KEY = int(os.environ.get("SPONSOR_PRIVATE_KEY", DEFAULT_SPONSOR_PRIVATE_KEY), 16)
 
+def parse_sponsors() -> list:
+    """Collect (address, private_key) pairs from SPONSOR_ADDRESS(ES)/SPONSOR_PRIVATE_KEY(S)"""
+    addresses = [a.strip() for a in os.environ.get("SPONSOR_ADDRESSES", "").split(",") if a.strip()]
+    keys = [k.strip() for k in os.environ.get("SPONSOR_PRIVATE_KEYS", "").split(",") if k.strip()]
+    if len(addresses) != len(keys):
+        raise ValueError(f"SPONSOR_ADDRESSES has {len(addresses)} entries but SPONSOR_PRIVATE_KEYS has {len(keys)}")
+
+    sponsors = []
+    if SPONSOR_ADDRESS != 0 and SPONSOR_PRIVATE_KEY != 0:
+        sponsors.append((SPONSOR_ADDRESS, SPONSOR_PRIVATE_KEY))
+    for address, key in zip(addresses, keys):
+        pair = (int(address, 16), int(key, 16))
+        if pair[0] != 0 and pair[1] != 0 and pair[0] not in [a for a, _ in sponsors]:
+            sponsors.append(pair)
+    return sponsors
+
+SPONSORS = []
+SPONSOR_MIN_BALANCE = MAX_CLAIM_FEE
+
+def load_config():
+    """Load .env (if python-dotenv is installed) and re-read the environment-driven settings"""
+    global RPC_URL, SPONSOR_ADDRESS, SPONSOR_PRIVATE_KEY, SPONSORS, SPONSOR_MIN_BALANCE
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()  # Load from .env in current directory or parent directories
+    except ImportError:
+        pass  # python-dotenv not installed, use shell environment only
+
+    RPC_URL = os.environ.get("STARKNET_RPC_URL", RPC_URL)
+    SPONSOR_ADDRESS = int(os.environ.get("SPONSOR_ADDRESS", DEFAULT_SPONSOR_ADDRESS), 16)
+    SPONSOR_PRIVATE_KEY = int(os.environ.get("SPONSOR_PRIVATE_KEY", DEFAULT_SPONSOR_PRIVATE_KEY), 16)
+    SPONSORS = parse_sponsors()
+    SPONSOR_MIN_BALANCE = int(os.environ.get("SPONSOR_MIN_BALANCE", MAX_CLAIM_FEE))
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECP256K1 UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -154,6 +196,8 @@ def get_garaga_signature_calldata(msg_hash: int, priv_key: int) -> list:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def compute_stealth_address(stealth_pub: tuple) -> str:
+    from starknet_py.hash.address import compute_address
+
     x_low = stealth_pub[0] & ((1 << 128) - 1)
     x_high = stealth_pub[0] >> 128
     y_low = stealth_pub[1] & ((1 << 128) - 1)
@@ -170,12 +214,145 @@ def compute_stealth_address(stealth_pub: tuple) -> str:
     )
     return hex(address)
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# SPONSOR POOL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Sponsor:
+    """A sponsor account with its own locally tracked nonce and in-flight claim count"""
+
+    def __init__(self, account):
+        import asyncio
+
+        self.account = account
+        self.address = account.address
+        self.balance = 0
+        self.in_flight = 0
+        self.nonce = None  # Fetched from chain on first use, then incremented locally
+        self.needs_resync = False
+        self._nonce_lock = asyncio.Lock()
+
+    async def next_nonce(self) -> int:
+        # Handing out nonces locally lets several claims from this sponsor be in flight at once
+        async with self._nonce_lock:
+            if self.nonce is None:
+                self.nonce = await self.account.get_nonce()
+            nonce = self.nonce
+            self.nonce += 1
+            return nonce
+
+    def mark_nonce_gap(self):
+        """
+        Record that execute_v3 failed, so the nonce it took was never used.
+
+        Claims already holding later nonces are stuck behind that gap, and re-reading
+        the chain nonce now could collide with them. The pool therefore stops routing
+        to this sponsor and only resyncs once its in-flight count drops to 0.
+        """
+        self.needs_resync = True
+
+    def try_resync(self):
+        if self.needs_resync and self.in_flight == 0:
+            self.nonce = None  # Next claim re-reads it from chain
+            self.needs_resync = False
+
+class SponsorPool:
+    """Routes claims across several sponsor accounts by in-flight load and STRK balance"""
+
+    def __init__(self, client, sponsors: list, min_balance: int = MAX_CLAIM_FEE):
+        from starknet_py.net.account.account import Account
+        from starknet_py.net.models import StarknetChainId
+        from starknet_py.net.signer.stark_curve_signer import KeyPair
+
+        import asyncio
+
+        self.client = client
+        self.min_balance = min_balance
+        self._balances_read_at = None
+        self._slot_freed = asyncio.Condition()
+        self._refresh_lock = asyncio.Lock()
+        self.sponsors = [
+            Sponsor(Account(
+                client=client,
+                address=address,
+                key_pair=KeyPair.from_private_key(private_key),
+                chain=StarknetChainId.SEPOLIA
+            ))
+            for address, private_key in sponsors
+        ]
+
+    async def get_balance(self, address: int) -> int:
+        from starknet_py.net.client_models import Call
+        from starknet_py.hash.selector import get_selector_from_name
+
+        try:
+            bal_resp = await self.client.call_contract(Call(
+                to_addr=STRK_TOKEN, selector=get_selector_from_name("balanceOf"), calldata=[address]
+            ))
+            return bal_resp[0]
+        except Exception as e:
+            print(f"  Sponsor {hex(address)} balance check error: {e}")
+            return 0
+
+    async def refresh_balances(self, max_age: float = SPONSOR_BALANCE_TTL):
+        """Re-read every sponsor balance, unless the last read is younger than max_age seconds"""
+        import asyncio
+
+        # Concurrent callers wait for one in-progress read instead of seeing stale zeros
+        async with self._refresh_lock:
+            if self._balances_read_at is not None and time.monotonic() - self._balances_read_at < max_age:
+                return
+            balances = await asyncio.gather(*(self.get_balance(s.address) for s in self.sponsors))
+            for sponsor, balance in zip(self.sponsors, balances):
+                sponsor.balance = balance
+            self._balances_read_at = time.monotonic()
+
+    def available_balance(self, sponsor: Sponsor) -> int:
+        # Balance left after reserving the worst-case fee of every claim already in flight
+        return sponsor.balance - sponsor.in_flight * MAX_CLAIM_FEE
+
+    async def acquire(self):
+        """
+        Pick the least-loaded sponsor with room for another claim (ties go to the
+        larger available balance), waiting for a slot if every sponsor is busy.
+        Returns None only if no sponsor could cover even a single claim.
+        """
+        while True:
+            await self.refresh_balances()
+            async with self._slot_freed:
+                if not any(s.balance >= self.min_balance for s in self.sponsors):
+                    return None
+                ready = [
+                    s for s in self.sponsors
+                    if not s.needs_resync and self.available_balance(s) >= self.min_balance
+                ]
+                if ready:
+                    sponsor = min(ready, key=lambda s: (s.in_flight, -self.available_balance(s)))
+                    sponsor.in_flight += 1
+                    return sponsor
+                # release() notifies under the same lock, so no wake-up can be missed
+                await self._slot_freed.wait()
+
+    async def release(self, sponsor: Sponsor, submitted: bool):
+        """
+        Return a sponsor slot and wake queued claims. A submitted tx used its nonce
+        even if it later reverted, so only a failed submission marks a nonce gap.
+        """
+        async with self._slot_freed:
+            sponsor.in_flight -= 1
+            if not submitted:
+                sponsor.mark_nonce_gap()
+            sponsor.try_resync()
+            self._slot_freed.notify_all()
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN GASLESS CLAIM FLOW (ATOMIC)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 async def get_application_nonce(client, address: int) -> int:
     """Read application-level nonce (sn_keccak('nonce')) from storage"""
+    from starknet_py.hash.selector import get_selector_from_name
+
     try:
         class_hash = await client.get_class_hash_at(address)
         if not class_hash: return 0
@@ -184,19 +361,25 @@ async def get_application_nonce(client, address: int) -> int:
     except:
         return 0
 
-async def gasless_claim(stealth_priv: int, recipient: str, expected_amount: int):
-    client = FullNodeClient(node_url=RPC_URL)
-    
-    if SPONSOR_ADDRESS == 0 or SPONSOR_PRIVATE_KEY == 0:
-        print("❌ Sponsor config missing")
-        return False
+def create_sponsor_pool() -> SponsorPool:
+    from starknet_py.net.full_node_client import FullNodeClient
 
-    sponsor_account = Account(
-        client=client,
-        address=SPONSOR_ADDRESS,
-        key_pair=KeyPair.from_private_key(SPONSOR_PRIVATE_KEY),
-        chain=StarknetChainId.SEPOLIA
-    )
+    return SponsorPool(FullNodeClient(node_url=RPC_URL), SPONSORS, SPONSOR_MIN_BALANCE)
+
+async def gasless_claim(stealth_priv: int, recipient: str, expected_amount: int, pool: SponsorPool = None):
+    if pool is None:
+        # Library callers skip main(), so pick up .env (SPONSOR_*, STARKNET_RPC_URL) here
+        load_config()
+        if not SPONSORS:
+            print("❌ Sponsor config missing")
+            return False
+        pool = create_sponsor_pool()
+
+    from starknet_py.net.client_models import Call, ResourceBounds, ResourceBoundsMapping
+    from starknet_py.hash.selector import get_selector_from_name
+    from poseidon_py.poseidon_hash import poseidon_hash_many
+
+    client = pool.client
 
     stealth_pub = derive_public_key(stealth_priv)
     stealth_address_hex = compute_stealth_address(stealth_pub)
@@ -288,18 +471,28 @@ async def gasless_claim(stealth_priv: int, recipient: str, expected_amount: int)
         calldata=atomic_calldata
     ))
     
+    # Route to a sponsor
+    sponsor = await pool.acquire()
+    if sponsor is None:
+        print(f"❌ No sponsor has the minimum balance ({pool.min_balance/1e18} STRK)")
+        return False
+
     # Execute Sponsor TX
-    print(f"  🚀 Executing Atomic Transaction via Sponsor...")
+    submitted = False
     try:
+        sponsor_nonce = await sponsor.next_nonce()
+        print(f"  🚀 Executing Atomic Transaction via Sponsor {hex(sponsor.address)} (nonce {sponsor_nonce})...")
         # Use execute_v3 with full ResourceBoundsMapping (starknet-py 0.29.x)
-        result = await sponsor_account.execute_v3(
+        result = await sponsor.account.execute_v3(
             calls=calls,
             resource_bounds=ResourceBoundsMapping(
-                l1_gas=ResourceBounds(max_amount=2000, max_price_per_unit=500_000_000_000_000),
-                l1_data_gas=ResourceBounds(max_amount=20000, max_price_per_unit=500_000_000_000_000),
-                l2_gas=ResourceBounds(max_amount=50_000_000, max_price_per_unit=10_000_000_000)
-            )
+                l1_gas=ResourceBounds(max_amount=L1_GAS_BOUNDS[0], max_price_per_unit=L1_GAS_BOUNDS[1]),
+                l1_data_gas=ResourceBounds(max_amount=L1_DATA_GAS_BOUNDS[0], max_price_per_unit=L1_DATA_GAS_BOUNDS[1]),
+                l2_gas=ResourceBounds(max_amount=L2_GAS_BOUNDS[0], max_price_per_unit=L2_GAS_BOUNDS[1])
+            ),
+            nonce=sponsor_nonce
         )
+        submitted = True
         print(f"  TX Hash: {hex(result.transaction_hash)}")
         
         await client.wait_for_tx(result.transaction_hash)
@@ -310,7 +503,67 @@ async def gasless_claim(stealth_priv: int, recipient: str, expected_amount: int)
         print(f"  ❌ Transaction Failed: {e}")
         return False
 
-async def main():
+    finally:
+        await pool.release(sponsor, submitted)
+
+async def gasless_claim_many(claims: list) -> list:
+    """Submit (stealth_priv, recipient, amount) claims concurrently across the sponsor pool"""
+    import asyncio
+
+    pool = create_sponsor_pool()
+    # Read balances once for the whole batch; concurrent acquires then reuse the cached
+    # read instead of each issuing one balanceOf per sponsor
+    await pool.refresh_balances(max_age=0)
+
+    # Cap how many claims do RPC prep at once; the rest queue here instead of in acquire()
+    limit = asyncio.Semaphore(CLAIMS_PER_SPONSOR * len(pool.sponsors))
+
+    async def limited_claim(stealth_priv, recipient, amount):
+        async with limit:
+            return await gasless_claim(stealth_priv, recipient, amount, pool)
+
+    results = await asyncio.gather(*(
+        limited_claim(stealth_priv, recipient, amount)
+        for stealth_priv, recipient, amount in claims
+    ), return_exceptions=True)
+
+    # One failing claim must not cancel the others, so exceptions count as failures
+    outcomes = []
+    for (_, recipient, _), result in zip(claims, results):
+        if isinstance(result, BaseException):
+            print(f"  ❌ Claim to {recipient} failed: {result}")
+            outcomes.append(False)
+        else:
+            outcomes.append(result)
+    return outcomes
+
+def parse_claim(stealth_priv: str, recipient: str, amount: str) -> tuple:
+    """Normalize one claim's CLI/JSON inputs, raising ValueError with a user-facing message"""
+    if not stealth_priv.startswith("0x"):
+        stealth_priv = "0x" + stealth_priv
+    if not recipient.startswith("0x"):
+        recipient = "0x" + recipient
+
+    try:
+        stealth_priv_int = int(stealth_priv, 16)
+    except ValueError:
+        raise ValueError("Invalid stealth private key format. Must be a hex string.")
+    if not 0 < stealth_priv_int < N:
+        raise ValueError("Invalid stealth private key. Must be between 1 and the secp256k1 order.")
+
+    try:
+        int(recipient, 16)
+    except ValueError:
+        raise ValueError(f"Invalid recipient address {recipient}. Must be a hex string.")
+
+    try:
+        amount_int = int(amount)
+    except ValueError:
+        raise ValueError("Invalid amount. Must be an integer (in wei).")
+
+    return stealth_priv_int, recipient, amount_int
+
+def main():
     print("\n" + "="*60)
     print("  StealthFlow Gasless Claim - Manual Execution")
     print("="*60)
@@ -325,16 +578,17 @@ Examples:
   
   Transfer specific amount:
     python3 gasless_claim.py --stealth-priv 0x1234...abcd --to 0xrecipient... --amount 1000000000000000000
+
+  Many claims at once (spread across SPONSOR_ADDRESSES):
+    python3 gasless_claim.py --claims-file claims.json
         """
     )
     parser.add_argument(
         "--stealth-priv", 
-        required=True,
         help="Stealth private key (hex format, provided by sender)"
     )
     parser.add_argument(
         "--to", 
-        required=True,
         help="Recipient address (your wallet address)"
     )
     parser.add_argument(
@@ -342,46 +596,61 @@ Examples:
         default="0", 
         help="Amount to transfer in wei (0 = sweep all available funds minus gas)"
     )
+    parser.add_argument(
+        "--claims-file",
+        help='JSON list of claims to submit concurrently: [{"stealth_priv": ..., "to": ..., "amount": ...}]'
+    )
     
     args = parser.parse_args()
+    if args.claims_file is None and (args.stealth_priv is None or args.to is None):
+        parser.error("--stealth-priv and --to are required unless --claims-file is given")
     
     # Validate inputs
-    stealth_priv = args.stealth_priv
-    if not stealth_priv.startswith("0x"):
-        stealth_priv = "0x" + stealth_priv
-    
-    recipient = args.to
-    if not recipient.startswith("0x"):
-        recipient = "0x" + recipient
-    
     try:
-        stealth_priv_int = int(stealth_priv, 16)
-    except ValueError:
-        print("\n❌ Invalid stealth private key format. Must be a hex string.")
+        if args.claims_file is None:
+            claims = [parse_claim(args.stealth_priv, args.to, args.amount)]
+        else:
+            import json
+            with open(args.claims_file) as f:
+                claims = [
+                    parse_claim(str(c["stealth_priv"]), str(c["to"]), str(c.get("amount", "0")))
+                    for c in json.load(f)
+                ]
+            if not claims:
+                raise ValueError(f"{args.claims_file} contains no claims")
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        print(f"\n❌ Invalid claim input: {e}")
         sys.exit(1)
     
+    # Check sponsor configuration
     try:
-        amount = int(args.amount)
-    except ValueError:
-        print("\n❌ Invalid amount. Must be an integer (in wei).")
+        load_config()
+    except ValueError as e:
+        print(f"\n❌ Invalid sponsor configuration: {e}")
         sys.exit(1)
-    
-    # Check sponsor configuration
-    if SPONSOR_ADDRESS == 0 or SPONSOR_PRIVATE_KEY == 0:
+    if not SPONSORS:
         print("\n❌ Sponsor configuration missing!")
         print("\nPlease set the following environment variables:")
         print("  export SPONSOR_ADDRESS=0x...")
         print("  export SPONSOR_PRIVATE_KEY=0x...")
+        print("\nOr, for a pool of sponsors:")
+        print("  export SPONSOR_ADDRESSES=0x...,0x...")
+        print("  export SPONSOR_PRIVATE_KEYS=0x...,0x...")
         print("\nThese are provided by the sender or the StealthFlow service.")
         sys.exit(1)
     
     print(f"\n📋 Claim Details:")
-    print(f"   Recipient: {recipient}")
-    print(f"   Amount: {'Sweep All' if amount == 0 else f'{amount} wei ({amount/1e18:.6f} STRK)'}")
-    print(f"   Sponsor: {hex(SPONSOR_ADDRESS)}")
+    for _, recipient, amount in claims:
+        print(f"   Recipient: {recipient}")
+        print(f"   Amount: {'Sweep All' if amount == 0 else f'{amount} wei ({amount/1e18:.6f} STRK)'}")
+    print(f"   Sponsors: {', '.join(hex(address) for address, _ in SPONSORS)}")
     
-    # Execute claim
-    success = await gasless_claim(stealth_priv_int, recipient, amount)
+    # Execute claims
+    import asyncio
+    results = asyncio.run(gasless_claim_many(claims))
+    success = all(results)
+    if len(claims) > 1:
+        print(f"\n   {sum(results)}/{len(claims)} claims succeeded")
     
     if success:
         print("\n" + "="*60)
@@ -395,4 +664,4 @@ Examples:
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
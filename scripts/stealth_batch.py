@@ -0,0 +1,369 @@
+"""
+StealthFlow Batch Engine - Vectorized secp256k1 Arithmetic for Scanning and Address Generation
+
+Optional NumPy backend. A batch of n field elements is stored as a (8, n) uint64
+array of 32-bit little-endian limbs, so limb products (< 2^64) never overflow and
+every field operation runs as a handful of whole-batch array passes.
+
+Curve operations use Jacobian coordinates (no inversions); the final conversion
+back to affine uses a single Montgomery batch inversion on Python ints.
+
+If NumPy is not installed, or the batch is smaller than NUMPY_MIN_BATCH, every
+function falls back to the scalar path in stealth_sdk.py. Both paths return
+identical results. Run scripts/bench_field_batch.py to measure the crossover.
+"""
+import random
+from typing import Tuple, Optional, List, Sequence, Union
+
+from stealth_sdk import P, N, G, point_add, point_mul, keccak256
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Below this batch size the NumPy call overhead outweighs the vectorization win.
+# Measured ECDH crossover is ~16-20 points (scripts/bench_field_batch.py); 32 leaves margin.
+NUMPY_MIN_BATCH = 32
+
+LIMBS = 8
+LIMB_BITS = 32
+LIMB_MASK = (1 << LIMB_BITS) - 1
+
+# 2^256 = 2^32 + 977 (mod P), used to fold the high half of a product back down
+_FOLD_LOW = 977
+
+Point = Tuple[int, int]
+JacobianBatch = Tuple["np.ndarray", "np.ndarray", "np.ndarray"]
+
+def _require_numpy():
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for the vectorized batch engine (pip install numpy)")
+
+def _use_numpy(use_numpy: Optional[bool], batch_size: int) -> bool:
+    if use_numpy is None:
+        return HAS_NUMPY and batch_size >= NUMPY_MIN_BATCH
+    if use_numpy:
+        _require_numpy()
+    return use_numpy
+
+# --- Limb Conversion ---
+def to_limbs(values: Sequence[int]) -> "np.ndarray":
+    """Pack ints in [0, 2^256) into a (8, n) uint64 array of 32-bit limbs."""
+    _require_numpy()
+    raw = b"".join(v.to_bytes(32, "little") for v in values)
+    return np.frombuffer(raw, dtype="<u4").reshape(len(values), LIMBS).T.astype(np.uint64)
+
+def from_limbs(a: "np.ndarray") -> List[int]:
+    """Unpack a normalized (8, n) limb array back into Python ints."""
+    raw = a.T.astype("<u4").tobytes()
+    return [int.from_bytes(raw[i:i + 32], "little") for i in range(0, len(raw), 32)]
+
+def _constant(value: int, n: int) -> "np.ndarray":
+    return np.repeat(to_limbs([value]), n, axis=1)
+
+_P_LIMBS = [(P >> (LIMB_BITS * i)) & LIMB_MASK for i in range(LIMBS)]
+
+# --- Reduction ---
+def _carry(t: "np.ndarray"):
+    """Propagate carries in place; the top limb absorbs any overflow."""
+    while True:
+        c = t[:-1] >> LIMB_BITS
+        if not c.any():
+            return
+        t[:-1] &= LIMB_MASK
+        t[1:] += c
+
+def _fold(t: "np.ndarray") -> "np.ndarray":
+    """Fold limbs >= 8 back into the low 256 bits using 2^256 = 2^32 + 977 (mod P)."""
+    hi = t[LIMBS:]
+    k = hi.shape[0]
+    r = np.zeros((max(LIMBS, k + 1) + 1, t.shape[1]), dtype=np.uint64)
+    r[:LIMBS] = t[:LIMBS]
+    r[:k] += hi * _FOLD_LOW
+    r[1:k + 1] += hi
+    _carry(r)
+    return r
+
+def _sub_p_if_ge(a: "np.ndarray") -> "np.ndarray":
+    """Return a - P where a >= P, else a (a < 2^256 < 2P, so once is enough)."""
+    d = np.empty_like(a)
+    borrow = np.zeros(a.shape[1], dtype=np.uint64)
+    for i in range(LIMBS):
+        x = a[i] + ((1 << LIMB_BITS) - _P_LIMBS[i]) - borrow
+        d[i] = x & LIMB_MASK
+        borrow = 1 - (x >> LIMB_BITS)
+    return np.where(borrow == 0, d, a)
+
+def fe_reduce(t: "np.ndarray") -> "np.ndarray":
+    """Reduce a (L, n) limb array (L > 8, limbs < 2^40) to canonical (8, n) form mod P."""
+    _carry(t)
+    while t[LIMBS:].any():
+        t = _fold(t)
+    return _sub_p_if_ge(t[:LIMBS])
+
+# --- Field Arithmetic (inputs must be canonical, i.e. < P) ---
+def fe_add(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    t = np.zeros((LIMBS + 1, a.shape[1]), dtype=np.uint64)
+    t[:LIMBS] = a + b
+    return fe_reduce(t)
+
+def fe_neg(a: "np.ndarray") -> "np.ndarray":
+    # P - a (a = 0 gives P, which the next reduction maps back to 0)
+    d = np.empty_like(a)
+    borrow = np.zeros(a.shape[1], dtype=np.uint64)
+    for i in range(LIMBS):
+        x = (_P_LIMBS[i] + (1 << LIMB_BITS)) - a[i] - borrow
+        d[i] = x & LIMB_MASK
+        borrow = 1 - (x >> LIMB_BITS)
+    return d
+
+def fe_sub(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    return fe_add(a, fe_neg(b))
+
+def fe_mul_small(a: "np.ndarray", c: int) -> "np.ndarray":
+    """Multiply by a small constant (c < 2^8)."""
+    t = np.zeros((LIMBS + 1, a.shape[1]), dtype=np.uint64)
+    t[:LIMBS] = a * np.uint64(c)
+    return fe_reduce(t)
+
+def fe_mul(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """Schoolbook 8x8 limb product, then reduce mod P."""
+    prod = a[:, None, :] * b[None, :, :]  # (8, 8, n), each < 2^64
+    lo = prod & LIMB_MASK
+    hi = prod >> LIMB_BITS
+    # Column sums: at most 16 terms < 2^32 each, so < 2^36
+    cols = np.zeros((2 * LIMBS + 1, a.shape[1]), dtype=np.uint64)
+    for i in range(LIMBS):
+        cols[i:i + LIMBS] += lo[i]
+        cols[i + 1:i + LIMBS + 1] += hi[i]
+    return fe_reduce(cols)
+
+def fe_sqr(a: "np.ndarray") -> "np.ndarray":
+    return fe_mul(a, a)
+
+# --- Jacobian Curve Arithmetic (a = 0) ---
+def jacobian_double(p: JacobianBatch) -> JacobianBatch:
+    """dbl-2009-l. Points must not be at infinity."""
+    x, y, z = p
+    a = fe_sqr(x)
+    b = fe_sqr(y)
+    c = fe_sqr(b)
+    d = fe_mul_small(fe_sub(fe_sub(fe_sqr(fe_add(x, b)), a), c), 2)
+    e = fe_mul_small(a, 3)
+    f = fe_sqr(e)
+    x3 = fe_sub(f, fe_mul_small(d, 2))
+    y3 = fe_sub(fe_mul(e, fe_sub(d, x3)), fe_mul_small(c, 8))
+    z3 = fe_mul_small(fe_mul(y, z), 2)
+    return x3, y3, z3
+
+def jacobian_add(p: JacobianBatch, q: JacobianBatch) -> JacobianBatch:
+    """add-2007-bl. Caller guarantees p != ±q and neither is at infinity."""
+    x1, y1, z1 = p
+    x2, y2, z2 = q
+    z1z1 = fe_sqr(z1)
+    z2z2 = fe_sqr(z2)
+    u1 = fe_mul(x1, z2z2)
+    u2 = fe_mul(x2, z1z1)
+    s1 = fe_mul(fe_mul(y1, z2), z2z2)
+    s2 = fe_mul(fe_mul(y2, z1), z1z1)
+    h = fe_sub(u2, u1)
+    i = fe_sqr(fe_mul_small(h, 2))
+    j = fe_mul(h, i)
+    r = fe_mul_small(fe_sub(s2, s1), 2)
+    v = fe_mul(u1, i)
+    x3 = fe_sub(fe_sub(fe_sqr(r), j), fe_mul_small(v, 2))
+    y3 = fe_sub(fe_mul(r, fe_sub(v, x3)), fe_mul_small(fe_mul(s1, j), 2))
+    z3 = fe_mul(fe_sub(fe_sub(fe_sqr(fe_add(z1, z2)), z1z1), z2z2), h)
+    return x3, y3, z3
+
+def _select(mask: "np.ndarray", a: JacobianBatch, b: JacobianBatch) -> JacobianBatch:
+    return tuple(np.where(mask, ai, bi) for ai, bi in zip(a, b))
+
+def _to_jacobian(points: Sequence[Point]) -> JacobianBatch:
+    x = to_limbs([pt[0] for pt in points])
+    y = to_limbs([pt[1] for pt in points])
+    return x, y, _constant(1, len(points))
+
+def _to_affine(p: JacobianBatch) -> List[Optional[Point]]:
+    """Convert back to affine with one Montgomery batch inversion (Z = 0 maps to None)."""
+    xs, ys, zs = (from_limbs(c) for c in p)
+    prefix = []
+    acc = 1
+    for z in zs:
+        prefix.append(acc)
+        if z:
+            acc = acc * z % P
+    inv = pow(acc, P - 2, P)
+    result: List[Optional[Point]] = [None] * len(zs)
+    for i in range(len(zs) - 1, -1, -1):
+        z = zs[i]
+        if not z:
+            continue
+        z_inv = inv * prefix[i] % P
+        inv = inv * z % P
+        z_inv2 = z_inv * z_inv % P
+        result[i] = (xs[i] * z_inv2 % P, ys[i] * z_inv2 * z_inv % P)
+    return result
+
+# --- Batch Point Operations ---
+def batch_point_double(
+    points: Sequence[Optional[Point]],
+    use_numpy: Optional[bool] = None,
+) -> List[Optional[Point]]:
+    """Return [2 * p for p in points]."""
+    if not _use_numpy(use_numpy, len(points)):
+        return [point_add(pt, pt) for pt in points]
+
+    # Points at infinity stay at infinity; only double the rest
+    generic = [i for i, pt in enumerate(points) if pt is not None]
+    result: List[Optional[Point]] = [None] * len(points)
+    if generic:
+        doubled = _to_affine(jacobian_double(_to_jacobian([points[i] for i in generic])))
+        for i, pt in zip(generic, doubled):
+            result[i] = pt
+    return result
+
+def batch_point_add(
+    p1s: Sequence[Optional[Point]],
+    p2s: Sequence[Optional[Point]],
+    use_numpy: Optional[bool] = None,
+) -> List[Optional[Point]]:
+    """Return [a + b for a, b in zip(p1s, p2s)]."""
+    if not _use_numpy(use_numpy, len(p1s)):
+        return [point_add(a, b) for a, b in zip(p1s, p2s)]
+
+    # Infinity and p1 == ±p2 are rare; route them through the scalar path
+    special = [i for i, (a, b) in enumerate(zip(p1s, p2s)) if a is None or b is None or a[0] == b[0]]
+    special_set = set(special)
+    generic = [i for i in range(len(p1s)) if i not in special_set]
+
+    result: List[Optional[Point]] = [None] * len(p1s)
+    if generic:
+        summed = _to_affine(jacobian_add(
+            _to_jacobian([p1s[i] for i in generic]),
+            _to_jacobian([p2s[i] for i in generic]),
+        ))
+        for i, pt in zip(generic, summed):
+            result[i] = pt
+    for i in special:
+        result[i] = point_add(p1s[i], p2s[i])
+    return result
+
+def _is_single_point(value) -> bool:
+    # A lone affine point is (x, y) with int coordinates; a batch is a sequence of those
+    return isinstance(value, (tuple, list)) and len(value) == 2 and isinstance(value[0], int)
+
+def _scalar_mul_vectorized(scalars: List[int], points: Sequence[Point]) -> List[Optional[Point]]:
+    """Vectorized right-to-left double-and-add; points must not be at infinity."""
+    n = len(scalars)
+
+    # Left-to-right would need a doubling on R; right-to-left keeps R = k_low * Q0 and
+    # Q = 2^i * Q0 with 0 < k_low < 2^i and k_low + 2^i < N, so R != ±Q and the
+    # generic addition formula is always valid.
+    q = _to_jacobian(points)
+    r = q
+    at_infinity = np.ones(n, dtype=bool)
+    scalar_limbs = to_limbs(scalars)
+    bit_length = max(k.bit_length() for k in scalars)
+
+    for i in range(bit_length):
+        bit = ((scalar_limbs[i // LIMB_BITS] >> np.uint64(i % LIMB_BITS)) & np.uint64(1)).astype(bool)
+        add_mask = bit & ~at_infinity
+        if add_mask.any():
+            r = _select(add_mask, jacobian_add(r, q), r)
+        init_mask = bit & at_infinity
+        if init_mask.any():
+            r = _select(init_mask, q, r)
+            at_infinity &= ~bit
+        if i < bit_length - 1:
+            q = jacobian_double(q)
+
+    result = _to_affine(r)
+    return [None if inf else pt for pt, inf in zip(result, at_infinity)]
+
+def batch_scalar_mul(
+    scalars: Union[int, Sequence[int]],
+    points: Union[Point, Sequence[Optional[Point]]],
+    use_numpy: Optional[bool] = None,
+) -> List[Optional[Point]]:
+    """
+    Return [k * p] for a batch. Either argument may be a single value shared by
+    the whole batch: one scalar over many points (scanner ECDH) or many scalars
+    over one point (k * G for address generation).
+    """
+    single_scalar = isinstance(scalars, int)
+    single_point = _is_single_point(points)
+    if single_scalar and single_point:
+        raise ValueError("At least one of scalars/points must be a sequence")
+    n = len(points) if single_scalar else len(scalars)
+    if single_scalar:
+        scalars = [scalars] * n
+    if single_point:
+        points = [tuple(points)] * n
+    scalars = [k % N for k in scalars]
+
+    if not _use_numpy(use_numpy, n):
+        return [point_mul(k, pt) for k, pt in zip(scalars, points)]
+
+    # Points at infinity stay at infinity; only multiply the rest
+    generic = [i for i, pt in enumerate(points) if pt is not None]
+    result: List[Optional[Point]] = [None] * n
+    if generic:
+        products = _scalar_mul_vectorized([scalars[i] for i in generic], [points[i] for i in generic])
+        for i, pt in zip(generic, products):
+            result[i] = pt
+    return result
+
+# --- Stealth Protocol Batches ---
+def batch_check_stealth_payments(
+    view_priv: int,
+    spend_pub: Point,
+    announcements: Sequence[Tuple[Point, int]],
+    use_numpy: Optional[bool] = None,
+) -> List[Optional[int]]:
+    """
+    Batch version of check_stealth_payment over (ephemeral_pub, view_tag) pairs.
+    Returns the shared-secret hash for matches, None otherwise.
+    """
+    if not announcements:
+        return []
+    shared_points = batch_scalar_mul(view_priv, [eph for eph, _ in announcements], use_numpy)
+
+    results: List[Optional[int]] = []
+    for (_, view_tag), shared in zip(announcements, shared_points):
+        hashed_s = keccak256(shared[0].to_bytes(32, 'big'))
+        results.append(int.from_bytes(hashed_s, 'big') if hashed_s[0] == view_tag else None)
+    return results
+
+def batch_generate_stealth_addresses(
+    view_pub: Point,
+    spend_pub: Point,
+    count: int,
+    rng: Optional[random.Random] = None,
+    use_numpy: Optional[bool] = None,
+) -> List[Tuple[Point, Point, int, int]]:
+    """
+    Batch version of generate_stealth_address.
+    Returns (stealth_pub, ephemeral_pub, view_tag, ephemeral_priv) tuples.
+    """
+    if rng is None:
+        rng = random
+    ephemeral_privs = [rng.randrange(1, N) for _ in range(count)]
+    if count == 0:
+        return []
+
+    ephemeral_pubs = batch_scalar_mul(ephemeral_privs, G, use_numpy)
+    shared_points = batch_scalar_mul(ephemeral_privs, view_pub, use_numpy)
+
+    hashes = [keccak256(s[0].to_bytes(32, 'big')) for s in shared_points]
+    part2 = batch_scalar_mul([int.from_bytes(h, 'big') % N for h in hashes], G, use_numpy)
+    stealth_pubs = batch_point_add([spend_pub] * count, part2, use_numpy)
+
+    return [
+        (stealth_pub, ephemeral_pub, hashed_s[0], ephemeral_priv)
+        for stealth_pub, ephemeral_pub, hashed_s, ephemeral_priv
+        in zip(stealth_pubs, ephemeral_pubs, hashes, ephemeral_privs)
+    ]
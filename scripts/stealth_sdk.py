@@ -2,8 +2,11 @@
 StealthFlow SDK - Stealth Address Generation and Garaga Signature Hints
 """
 import hashlib
+import json
+import os
 import random
-from typing import Tuple, Optional, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, Optional, List, Dict
 
 # --- secp256k1 curve parameters ---
 P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
@@ -52,10 +55,15 @@ def keccak256(data: bytes) -> bytes:
         return k.digest()
 
 # --- ECDSA Signing ---
-def sign_message(msg_hash: int, priv_key: int) -> Tuple[int, int, int]:
-    """Sign a message hash with secp256k1 private key. Returns (r, s, v)."""
+def sign_message(msg_hash: int, priv_key: int, rng: Optional[random.Random] = None) -> Tuple[int, int, int]:
+    """Sign a message hash with secp256k1 private key. Returns (r, s, v).
+
+    Pass a seeded `rng` to make the nonce (and therefore the signature) reproducible.
+    """
+    if rng is None:
+        rng = random
     while True:
-        k = random.randrange(1, N)
+        k = rng.randrange(1, N)
         R = point_mul(k, G)
         r = R[0] % N
         if r == 0:
@@ -74,7 +82,9 @@ def sign_message(msg_hash: int, priv_key: int) -> Tuple[int, int, int]:
 
 
 # --- Garaga Signature Hint Generation ---
-def get_garaga_signature_calldata(msg_hash: int, priv_key: int) -> List[int]:
+def get_garaga_signature_calldata(
+    msg_hash: int, priv_key: int, rng: Optional[random.Random] = None
+) -> List[int]:
     """
     Sign message and generate Garaga signature calldata with hints.
     
@@ -83,7 +93,7 @@ def get_garaga_signature_calldata(msg_hash: int, priv_key: int) -> List[int]:
     Returns: List of felts to be used as the 'signature' field in Starknet transaction.
     """
     # 1. Sign the message
-    r, s, v = sign_message(msg_hash, priv_key)
+    r, s, v = sign_message(msg_hash, priv_key, rng)
     
     # 2. Get public key
     pub = point_mul(priv_key, G)
@@ -215,6 +225,155 @@ def print_test_vector(tx_hash: int = None, priv_key: int = None):
     print("=" * 70)
 
 
+# --- Bulk Test-Vector Corpus ---
+def generate_test_vector(seed: int, index: int) -> Dict:
+    """
+    Generate one deterministic test vector for the Cairo corpus.
+
+    The key, tx_hash and ECDSA nonce are all drawn from an RNG seeded with
+    (seed, index), so any vector can be rebuilt on its own without replaying
+    the rest of the corpus.
+    """
+    # String seeds are hashed with SHA-512, so distinct (seed, index) pairs never collide
+    rng = random.Random(f"{seed}:{index}")
+    priv_key = rng.randrange(1, N)
+    tx_hash = rng.randrange(1, 2**251)  # must fit in a felt252
+    pub_key = point_mul(priv_key, G)
+    signature = get_garaga_signature_calldata(tx_hash, priv_key, rng)
+
+    return {
+        "index": index,
+        "tx_hash": tx_hash,
+        "priv_key": priv_key,
+        "signature": signature,
+        "pub_key_x_low": pub_key[0] & ((1 << 128) - 1),
+        "pub_key_x_high": pub_key[0] >> 128,
+        "pub_key_y_low": pub_key[1] & ((1 << 128) - 1),
+        "pub_key_y_high": pub_key[1] >> 128,
+    }
+
+
+def _generate_test_vector_task(task: Tuple[int, int]) -> Dict:
+    # Top-level helper so ProcessPoolExecutor can pickle it
+    return generate_test_vector(*task)
+
+
+def format_corpus_cairo(vectors: List[Dict], seed: int) -> str:
+    """
+    Format a corpus as a Cairo data module: one function per vector plus a
+    get_vector(index) dispatcher, so tests can loop over 0..VECTOR_COUNT.
+    """
+    lines = [
+        f"// Generated by stealth_sdk.py --corpus (seed={seed}, count={len(vectors)})",
+        "// Rebuild with the same seed and count to reproduce this file byte-for-byte.",
+        "",
+        "#[derive(Drop)]",
+        "pub struct TestVector {",
+        "    pub tx_hash: felt252,",
+        "    pub signature: Array<felt252>,",
+        "    pub pub_key_x_low: u128,",
+        "    pub pub_key_x_high: u128,",
+        "    pub pub_key_y_low: u128,",
+        "    pub pub_key_y_high: u128,",
+        "}",
+        "",
+        f"pub const VECTOR_COUNT: u32 = {len(vectors)};",
+    ]
+
+    for vector in vectors:
+        signature = ", ".join(str(felt) for felt in vector["signature"])
+        lines.append("")
+        lines.append(f"pub fn vector_{vector['index']}() -> TestVector {{")
+        lines.append("    TestVector {")
+        lines.append(f"        tx_hash: {hex(vector['tx_hash'])},")
+        lines.append(f"        signature: array![{signature}],")
+        lines.append(f"        pub_key_x_low: {vector['pub_key_x_low']},")
+        lines.append(f"        pub_key_x_high: {vector['pub_key_x_high']},")
+        lines.append(f"        pub_key_y_low: {vector['pub_key_y_low']},")
+        lines.append(f"        pub_key_y_high: {vector['pub_key_y_high']},")
+        lines.append("    }")
+        lines.append("}")
+
+    # Cairo integer match arms must run 0, 1, 2, ... in order, which the corpus guarantees
+    lines.append("")
+    lines.append("pub fn get_vector(index: u32) -> TestVector {")
+    lines.append("    match index {")
+    for vector in vectors:
+        lines.append(f"        {vector['index']} => vector_{vector['index']}(),")
+    lines.append("        _ => panic!(\"test vector index out of range\"),")
+    lines.append("    }")
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def format_corpus_json(vectors: List[Dict], seed: int) -> str:
+    """Format a corpus as JSON (felts as hex strings)."""
+    corpus = {
+        "seed": seed,
+        "count": len(vectors),
+        "vectors": [
+            {
+                key: ([hex(felt) for felt in value] if key == "signature"
+                      else value if key == "index" else hex(value))
+                for key, value in vector.items()
+            }
+            for vector in vectors
+        ],
+    }
+    return json.dumps(corpus, indent=2) + "\n"
+
+
+def generate_test_corpus(
+    count: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Generate `count` test vectors in parallel worker processes.
+
+    Output order (and content) depends only on `seed` and `count`, never on
+    the number of workers.
+    """
+    tasks = [(seed, index) for index in range(count)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        return [_generate_test_vector_task(task) for task in tasks]
+    if chunksize is None:
+        # ~4 chunks per worker keeps IPC overhead low without idling workers at the tail
+        chunksize = max(1, count // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_generate_test_vector_task, tasks, chunksize=chunksize))
+
+
+def write_test_corpus(
+    path: str,
+    count: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    fmt: Optional[str] = None,
+) -> int:
+    """
+    Generate a corpus and write it to `path` as JSON or a Cairo data file.
+
+    The format defaults to the file extension (.cairo, otherwise JSON).
+    Returns the number of vectors written.
+    """
+    if fmt is None:
+        fmt = "cairo" if path.endswith(".cairo") else "json"
+    if fmt not in ("cairo", "json"):
+        raise ValueError(f"Unknown corpus format: {fmt}")
+
+    vectors = generate_test_corpus(count, seed, workers)
+    content = format_corpus_cairo(vectors, seed) if fmt == "cairo" else format_corpus_json(vectors, seed)
+    with open(path, "w") as f:
+        f.write(content)
+    return len(vectors)
+
+
 # --- Demo ---
 if __name__ == "__main__":
     import sys
@@ -223,7 +382,33 @@ if __name__ == "__main__":
         # Generate test vector mode
         print_test_vector()
         sys.exit(0)
-    
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--corpus":
+        # Bulk corpus mode: python3 scripts/stealth_sdk.py --corpus <count> [options]
+        import argparse
+        import time
+
+        parser = argparse.ArgumentParser(
+            prog="stealth_sdk.py --corpus",
+            description="Generate a deterministic corpus of Garaga-signed Cairo test vectors.",
+        )
+        parser.add_argument("count", type=int, help="Number of vectors to generate")
+        parser.add_argument("--seed", type=int, default=0, help="Corpus seed (default: 0)")
+        parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+        parser.add_argument("--out", default="test_vectors.json", help="Output file (.json or .cairo)")
+        parser.add_argument("--format", choices=["json", "cairo"], default=None, help="Override format detection")
+        args = parser.parse_args(sys.argv[2:])
+        if args.count < 1:
+            parser.error("count must be at least 1")
+        if args.workers is not None and args.workers < 1:
+            parser.error("--workers must be at least 1")
+
+        start = time.perf_counter()
+        written = write_test_corpus(args.out, args.count, args.seed, args.workers, args.format)
+        elapsed = time.perf_counter() - start
+        print(f"✓ Wrote {written} test vectors to {args.out} in {elapsed:.1f}s (seed={args.seed})")
+        sys.exit(0)
+
     if len(sys.argv) > 1 and sys.argv[1] == "--announce":
         # Generate announcement data for on-chain use
         print("\n" + "=" * 70)